@@ -36,19 +36,46 @@ RESOLUTION_OPTIONS = {
     "1w": "1 week"
 }
 
+# Candle length in seconds for each supported resolution
+RESOLUTION_SECONDS = {
+    "1m": 60,
+    "3m": 180,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "2h": 7200,
+    "4h": 14400,
+    "6h": 21600,
+    "1d": 86400,
+    "1w": 604800
+}
+
 # Default resolution
 RESOLUTION = "1m"  # Default to 1 minute candles
 
 # Rate limiting (requests per second) - being conservative for public endpoints
 MAX_REQUESTS_PER_SECOND = 5
-REQUEST_DELAY = 1 / MAX_REQUESTS_PER_SECOND
+# Requests allowed back-to-back before the token bucket starts throttling
+RATE_LIMIT_BURST = MAX_REQUESTS_PER_SECOND
+# Retries for rate limited (429) and server error (5xx) responses before a symbol is aborted
+MAX_RETRIES = 5
+# Symbols fetched in parallel; all workers share the rate limit above
+MAX_WORKERS = 8
 
 # Output Configuration
 OUTPUT_DIR = "data"
+OUTPUT_FORMAT = "csv"  # "csv" or "parquet" (technical_indicators.py reads CSV)
 CSV_FILENAME_FORMAT = "{symbol}_{start_date}_{end_date}.csv"
 
+# Cache Configuration
+# Closed candle batches are immutable and cached indefinitely; batches that
+# still include live candles are never cached
+CACHE_DIR = os.path.join(OUTPUT_DIR, ".cache")
+
 # Ensure output directory exists
 os.makedirs(OUTPUT_DIR, exist_ok=True)
+os.makedirs(CACHE_DIR, exist_ok=True)
 
 def get_date_range():
     """Get start and end dates for the last 10 days"""
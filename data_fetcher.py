@@ -1,16 +1,30 @@
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
+import hashlib
+import random
 import time
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
+from operator import itemgetter
 import logging
 import warnings
 
 from config import (
-    BASE_URL, API_VERSION, RESOLUTION, REQUEST_DELAY,
-    OUTPUT_DIR, CSV_FILENAME_FORMAT, get_date_range, IST,
-    RESOLUTION_OPTIONS
+    BASE_URL, API_VERSION, RESOLUTION, MAX_REQUESTS_PER_SECOND, RATE_LIMIT_BURST,
+    OUTPUT_DIR, OUTPUT_FORMAT, CSV_FILENAME_FORMAT, get_date_range, IST,
+    RESOLUTION_OPTIONS, RESOLUTION_SECONDS, CACHE_DIR,
+    MAX_RETRIES, MAX_WORKERS
 )
 
 # Suppress pandas warnings for cleaner output
@@ -23,6 +37,64 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Column types of a candle as returned by the history/candles endpoint
+CANDLE_SCHEMA = pa.schema([
+    ('time', pa.int64()),
+    ('open', pa.float64()),
+    ('high', pa.float64()),
+    ('low', pa.float64()),
+    ('close', pa.float64()),
+    ('volume', pa.float64())
+])
+
+# Pulls one candle's fields out as a tuple in schema order, in a single C call
+CANDLE_FIELDS = itemgetter(*CANDLE_SCHEMA.names)
+
+# India has observed a fixed UTC+05:30 without DST since 1945, so a constant
+# offset converts any candle timestamp without a timezone database lookup
+IST_OFFSET_SECONDS = int(IST.utcoffset(datetime(2000, 1, 1)).total_seconds())
+
+def epoch_to_ist(epoch: np.ndarray) -> np.ndarray:
+    """Convert Unix epoch seconds to naive IST wall-clock datetime64[s] values"""
+    return (epoch.astype('int64') + IST_OFFSET_SECONDS).astype('datetime64[s]')
+
+class TokenBucket:
+    def __init__(self, capacity: float, rate: float):
+        """
+        Thread-safe token bucket rate limiter shared by all fetch workers
+        
+        Args:
+            capacity: Maximum number of requests allowed in a burst
+            rate: Number of tokens refilled per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cost: float = 1):
+        """
+        Block until enough tokens are available
+        
+        Bursts up to capacity pass immediately; beyond that, callers wait
+        only as long as the refill rate requires
+        
+        Args:
+            cost: Number of tokens consumed by the request (default: 1)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            
+            # Reserve the token up front so waiting threads queue up behind each other
+            wait = max(0.0, (cost - self.tokens) / self.rate)
+            self.tokens -= cost
+        
+        if wait > 0:
+            time.sleep(wait)
+
 class DeltaExchangeDataFetcher:
     def __init__(self, resolution: str = RESOLUTION):
         """
@@ -38,20 +110,45 @@ class DeltaExchangeDataFetcher:
         
         self.base_url = BASE_URL
         self.resolution = resolution
+        self.batch_duration = self._calculate_batch_duration()
         self.session = requests.Session()
         # Simplified headers for public endpoints
         self.session.headers.update({
             'Accept': 'application/json',
-            'User-Agent': 'python-historical-data-fetcher/2025.1'
+            'User-Agent': 'python-historical-data-fetcher/2025.1',
+            'Connection': 'keep-alive'
         })
         
+        # Keep connections to the single API host alive across batches and workers
+        # Only connection/read errors are retried here; status retries (including
+        # Retry-After on 413/429/503) are disabled so 429/5xx responses go through
+        # _get_with_retries, where every attempt takes a token from the bucket
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=Retry(connect=3, read=3, status=0, backoff_factor=0.3,
+                              respect_retry_after_header=False)
+        )
+        self.session.mount("https://", adapter)
+        # Shared across symbols so concurrent fetches stay within the public rate limit
+        self.bucket = TokenBucket(RATE_LIMIT_BURST, MAX_REQUESTS_PER_SECOND)
+        
         logger.info(f"Initialized data fetcher with {RESOLUTION_OPTIONS[resolution]} resolution")
 
-    def fetch_candles_batch(self, symbol: str, start: int, end: int) -> Optional[List[Dict]]:
+    def fetch_candles_batch(self, symbol: str, start: int, end: int) -> pa.RecordBatch:
         """
-        Fetch a batch of candles for a given symbol and time range
-        Max 2000 candles per request
+        Fetch a batch of candles for a given symbol and time range as an Arrow record batch
+        Max 2000 candles per request. Responses are cached on disk under CACHE_DIR
+        
+        Raises on HTTP errors, API errors and undecodable responses so the symbol is
+        aborted instead of silently skipping the range
         """
+        cache_path = self._cache_path(symbol, start, end)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            logger.info("Cache hit for %s %s data from %d to %d", symbol, RESOLUTION_OPTIONS[self.resolution], start, end)
+            return cached
+        
         url = f"{self.base_url}/{API_VERSION}/history/candles"
         
         params = {
@@ -61,42 +158,110 @@ class DeltaExchangeDataFetcher:
             'end': end
         }
         
-        try:
-            logger.info(f"Fetching {symbol} {RESOLUTION_OPTIONS[self.resolution]} data from {start} to {end}")
+        logger.info("Fetching %s %s data from %d to %d", symbol, RESOLUTION_OPTIONS[self.resolution], start, end)
+        # Any failure below raises, aborting the symbol instead of leaving a gap
+        response = self._get_with_retries(url, params, symbol)
+        response.raise_for_status()
+        
+        # orjson parses the raw body bytes directly, skipping the text decode step
+        data = orjson.loads(response.content)
+        # Release the raw body before building columns so only one copy is held
+        del response
+        
+        if not data.get('success', False):
+            raise RuntimeError(f"API returned error for {symbol}: {data}")
+        
+        result = data.get('result', [])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Successfully fetched %d %s candles for %s", len(result), RESOLUTION_OPTIONS[self.resolution], symbol)
+        batch = self._candles_to_batch(result)
+        # Batches ending within the last candle may still change upstream,
+        # so only closed batches are cached
+        if end < int(time.time()) - RESOLUTION_SECONDS[self.resolution]:
+            self._write_cache(cache_path, batch)
+        return batch
+
+    def _get_with_retries(self, url: str, params: Dict, symbol: str) -> requests.Response:
+        """
+        GET with retries for rate limited (429) and server error (5xx) responses
+        
+        429 responses wait for the Retry-After header, 5xx responses back off
+        exponentially; both add jitter. Other responses are returned as-is
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            self.bucket.acquire()
             response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
             
-            data = response.json()
+            if response.status_code != 429 and response.status_code < 500:
+                return response
             
-            if data.get('success', False):
-                result = data.get('result', [])
-                logger.info(f"Successfully fetched {len(result)} {RESOLUTION_OPTIONS[self.resolution]} candles for {symbol}")
-                return result
+            if attempt == MAX_RETRIES:
+                break
+            
+            if response.status_code == 429:
+                try:
+                    delay = float(response.headers.get('Retry-After', '1'))
+                except ValueError:
+                    delay = 1.0  # HTTP-date form, fall back to a short wait
             else:
-                logger.error(f"API returned error for {symbol}: {data}")
-                return None
-                
-        except requests.RequestException as e:
-            logger.error(f"Request failed for {symbol}: {e}")
+                delay = 2 ** attempt * 0.5
+            delay += random.uniform(0, delay * 0.1)
+            
+            logger.warning("HTTP %d for %s, retrying in %.2fs (%d/%d)", response.status_code, symbol, delay, attempt + 1, MAX_RETRIES)
+            time.sleep(delay)
+        
+        logger.error("Giving up on %s after %d retries", symbol, MAX_RETRIES)
+        response.raise_for_status()
+        return response
+
+    def _candles_to_batch(self, candles: List[Dict]) -> pa.RecordBatch:
+        """Convert API candle dicts to a record batch, specialised for the fixed candle schema"""
+        # All six fields are numeric and epoch seconds are exact in float64, so one
+        # (n, 6) float64 array is filled in a single pass and transposed into
+        # contiguous per-column rows
+        rows = np.array(list(map(CANDLE_FIELDS, candles)), dtype=np.float64)
+        columns = rows.reshape(-1, len(CANDLE_SCHEMA)).T.copy()
+        arrays = [
+            pa.array(columns[i].astype(field.type.to_pandas_dtype(), copy=False))
+            for i, field in enumerate(CANDLE_SCHEMA)
+        ]
+        return pa.RecordBatch.from_arrays(arrays, schema=CANDLE_SCHEMA)
+
+    def _cache_path(self, symbol: str, start: int, end: int) -> str:
+        """Build the cache file path for a (symbol, resolution, start, end) batch"""
+        key = hashlib.blake2b(f"{symbol}|{self.resolution}|{start}|{end}".encode(), digest_size=16)
+        return os.path.join(CACHE_DIR, f"{key.hexdigest()}.parquet")
+
+    def _read_cache(self, cache_path: str) -> Optional[pa.RecordBatch]:
+        """Return cached candles, or None on a miss"""
+        if not os.path.exists(cache_path):
             return None
+        
+        try:
+            batches = pq.read_table(cache_path).cast(CANDLE_SCHEMA).combine_chunks().to_batches()
+            return batches[0] if batches else self._candles_to_batch([])
         except Exception as e:
-            logger.error(f"Unexpected error for {symbol}: {e}")
+            logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
             return None
 
+    def _write_cache(self, cache_path: str, batch: pa.RecordBatch):
+        """Persist a closed batch of candles to the cache"""
+        try:
+            # Write to a temporary file first so readers never see a partial file
+            tmp_path = f"{cache_path}.tmp"
+            pq.write_table(pa.Table.from_batches([batch]), tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to write cache file {cache_path}: {e}")
+
     def _calculate_batch_duration(self) -> int:
         """Calculate optimal batch duration based on resolution to stay under 2000 candle limit"""
-        resolution_minutes = {
-            "1m": 1, "3m": 3, "5m": 5, "15m": 15, "30m": 30,
-            "1h": 60, "2h": 120, "4h": 240, "6h": 360,
-            "1d": 1440, "1w": 10080
-        }
-        
-        minutes_per_candle = resolution_minutes.get(self.resolution, 1)
+        seconds_per_candle = RESOLUTION_SECONDS[self.resolution]
         max_candles = 1800  # Stay safely under 2000 limit
         
         # Calculate days that give us ~1800 candles
-        total_minutes = max_candles * minutes_per_candle
-        days = total_minutes / (24 * 60)
+        total_seconds = max_candles * seconds_per_candle
+        days = total_seconds / (24 * 60 * 60)
         
         # Ensure minimum of 1 day, maximum reasonable based on resolution
         if self.resolution in ["1m", "3m", "5m"]:
@@ -108,96 +273,173 @@ class DeltaExchangeDataFetcher:
         
         return int(days * 24 * 60 * 60)  # Convert to seconds
 
-    def fetch_all_candles(self, symbol: str, start_timestamp: int, end_timestamp: int) -> List[Dict]:
+    def iter_candle_batches(self, symbol: str, start_timestamp: int, end_timestamp: int) -> Iterator[pa.RecordBatch]:
         """
-        Fetch all candles for a symbol, handling pagination due to 2000 candle limit
+        Yield candle batches for a symbol, handling pagination due to 2000 candle limit
+        Only one batch is held at a time, so callers can stream arbitrarily long histories
         """
-        all_candles = []
-        current_start = start_timestamp
+        total_candles = 0
         
-        # Calculate batch size dynamically based on resolution
-        batch_duration = self._calculate_batch_duration()
+        # Batch size is derived from the resolution once in __init__
+        batch_duration = self.batch_duration
         
-        logger.info(f"Using batch duration of {batch_duration // (24*60*60)} days for {RESOLUTION_OPTIONS[self.resolution]} resolution")
+        # Align batch windows to fixed boundaries so that closed batches map to
+        # the same cache keys on every run
+        current_start = start_timestamp - start_timestamp % batch_duration
+        
+        logger.info("Using batch duration of %d days for %s resolution", batch_duration // (24*60*60), RESOLUTION_OPTIONS[self.resolution])
         
         while current_start < end_timestamp:
-            current_end = min(current_start + batch_duration, end_timestamp)
+            current_end = min(current_start + batch_duration - 1, end_timestamp)
             
             batch_candles = self.fetch_candles_batch(symbol, current_start, current_end)
             
-            if batch_candles:
-                all_candles.extend(batch_candles)
-                logger.info(f"Total {RESOLUTION_OPTIONS[self.resolution]} candles collected for {symbol}: {len(all_candles)}")
+            if batch_candles.num_rows > 0:
+                # The first aligned batch may start before the requested range
+                in_range = pc.and_(pc.greater_equal(batch_candles['time'], start_timestamp),
+                                   pc.less_equal(batch_candles['time'], end_timestamp))
+                batch_candles = batch_candles.filter(in_range)
+                total_candles += batch_candles.num_rows
+                logger.info("Total %s candles collected for %s: %d", RESOLUTION_OPTIONS[self.resolution], symbol, total_candles)
+                yield batch_candles
             else:
-                logger.warning(f"No data received for {symbol} batch")
-            
-            current_start = current_end + 1
+                logger.warning("No candles returned for %s batch", symbol)
             
-            # Rate limiting for public endpoints
-            time.sleep(REQUEST_DELAY)
+            current_start += batch_duration
+
+    def fetch_all_candles(self, symbol: str, start_timestamp: int, end_timestamp: int) -> pa.Table:
+        """
+        Fetch all candles for a symbol as one table
+        Batches are collected as Arrow record batches and concatenated once at the end
+        """
+        batches = list(self.iter_candle_batches(symbol, start_timestamp, end_timestamp))
+        table = self._deduplicate_candles(pa.Table.from_batches(batches, schema=CANDLE_SCHEMA), symbol)
         
-        logger.info(f"Completed fetching {len(all_candles)} total {RESOLUTION_OPTIONS[self.resolution]} candles for {symbol}")
-        return all_candles
+        logger.info("Completed fetching %d total %s candles for %s", table.num_rows, RESOLUTION_OPTIONS[self.resolution], symbol)
+        return table
 
-    def candles_to_dataframe(self, candles: List[Dict], symbol: str) -> pd.DataFrame:
-        """Convert candles data to pandas DataFrame with enhanced data types"""
-        if not candles:
-            logger.warning(f"No candles data to convert for {symbol}")
-            return pd.DataFrame()
+    def _deduplicate_candles(self, table: pa.Table, symbol: str) -> pa.Table:
+        """Order candles by time and drop boundary candles returned by two adjacent batches"""
+        times = table['time'].to_numpy()
         
-        df = pd.DataFrame(candles)
+        if not np.all(times[1:] >= times[:-1]):
+            # Stable sort, so the first copy of a duplicated candle is the one kept
+            order = pc.sort_indices(table, sort_keys=[('time', 'ascending')])
+            table = table.take(order)
+            times = table['time'].to_numpy()
         
-        # Convert timestamp to readable datetime
-        df['datetime'] = pd.to_datetime(df['time'], unit='s', utc=True)
-        df['datetime_ist'] = df['datetime'].dt.tz_convert(IST)
+        is_first = np.ones(len(times), dtype=bool)
+        is_first[1:] = times[1:] != times[:-1]
         
-        # Add symbol column
-        df['symbol'] = symbol
+        duplicates = len(times) - int(is_first.sum())
+        if duplicates:
+            logger.info("Dropped %d duplicate boundary candles for %s", duplicates, symbol)
+            table = table.filter(pa.array(is_first))
         
-        # Ensure proper data types
-        numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        return table
+
+    def candles_to_dataframe(self, candles: pa.Table, symbol: str) -> pd.DataFrame:
+        """Convert candles table to pandas DataFrame with enhanced data types"""
+        if candles.num_rows == 0:
+            logger.warning("No candles data to convert for %s", symbol)
+            return pd.DataFrame()
+        
+        df = candles.to_pandas()
+        
+        # Add symbol column. Readable datetimes are derived from the epoch 'time'
+        # column only when the data is written, see _add_datetime_columns
+        df['symbol'] = symbol
         
         # Reorder columns for better readability
-        columns = ['symbol', 'datetime_ist', 'datetime', 'time', 'open', 'high', 'low', 'close', 'volume']
-        available_columns = [col for col in columns if col in df.columns]
-        df = df[available_columns]
+        columns = ['symbol', 'time', 'open', 'high', 'low', 'close', 'volume']
+        df = df[columns]
+        df = self._downcast_columns(df)
         
-        # Sort by time and reset index
-        df = df.sort_values('time').reset_index(drop=True)
+        # fetch_all_candles already returns candles ordered by time without duplicates
+        assert df['time'].is_monotonic_increasing, f"{symbol} candles are not in time order"
         
-        # Add data quality metrics
-        df['price_change'] = df['close'] - df['open']
-        df['price_change_pct'] = (df['price_change'] / df['open'] * 100).round(4)
+        # Add data quality metrics directly on the arrays, skipping index alignment
+        close = df['close'].to_numpy()
+        open_ = df['open'].to_numpy()
+        price_change = close - open_
+        # A zero open would divide to inf/NaN, report it as no change instead
+        price_change_pct = np.divide(price_change, open_, out=np.zeros_like(price_change), where=open_ != 0)
+        df['price_change'] = price_change
+        df['price_change_pct'] = np.round(price_change_pct * 100.0, 4).astype('float32')
         
-        logger.info(f"Created DataFrame for {symbol} with {len(df)} rows and {len(df.columns)} columns")
+        logger.info("Created DataFrame for %s with %d rows and %d columns", symbol, len(df), len(df.columns))
+        return df
+
+    def _downcast_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Shrink column dtypes wherever the narrower type holds every value exactly"""
+        df['time'] = pd.to_numeric(df['time'], downcast='integer')
+        df['volume'] = pd.to_numeric(df['volume'], downcast='unsigned')
+        
+        # Most decimal prices are not representable in float32, so only keep
+        # the narrower column when it round-trips without loss
+        for col in ['open', 'high', 'low', 'close']:
+            narrow = df[col].astype('float32')
+            if narrow.astype('float64').equals(df[col]):
+                df[col] = narrow
+        
+        # A single repeated symbol per frame is ideal for a categorical
+        df['symbol'] = df['symbol'].astype('category')
         return df
 
     def save_to_csv(self, df: pd.DataFrame, symbol: str, start_date: datetime, end_date: datetime):
-        """Save DataFrame to CSV file with metadata"""
+        """Save DataFrame to CSV or Parquet depending on OUTPUT_FORMAT"""
         if df.empty:
             logger.warning(f"No data to save for {symbol}")
             return
         
-        start_str = start_date.strftime('%Y%m%d')
-        end_str = end_date.strftime('%Y%m%d')
-        
-        # Include resolution in filename
-        filename = f"{symbol}_{self.resolution}_{start_str}_{end_str}.csv"
-        filepath = f"{OUTPUT_DIR}/{filename}"
+        filepath = self._output_path(symbol, start_date, end_date, OUTPUT_FORMAT)
+        table = pa.Table.from_pandas(df, preserve_index=False)
         
-        # Save with optimized settings
-        df.to_csv(filepath, 
-                 index=False, 
-                 float_format='%.8f',
-                 date_format='%Y-%m-%d %H:%M:%S')
+        if OUTPUT_FORMAT == "parquet":
+            pq.write_table(table, filepath, compression='zstd', use_dictionary=True)
+        else:
+            # pyarrow's multi-threaded writer instead of pandas' per-value formatting
+            table = self._add_datetime_columns(table)
+            pacsv.write_csv(self._format_for_csv(table), filepath,
+                            write_options=pacsv.WriteOptions(include_header=True))
         
         # Log file statistics
         file_size = os.path.getsize(filepath) / 1024  # Size in KB
         logger.info(f"Saved {len(df)} {RESOLUTION_OPTIONS[self.resolution]} records to {filepath} ({file_size:.2f} KB)")
 
+    def _output_path(self, symbol: str, start_date: datetime, end_date: datetime, extension: str, suffix: str = "") -> str:
+        """Build the output file path, including the resolution in the filename"""
+        start_str = start_date.strftime('%Y%m%d')
+        end_str = end_date.strftime('%Y%m%d')
+        return f"{OUTPUT_DIR}/{symbol}_{self.resolution}_{start_str}_{end_str}{suffix}.{extension}"
+
+    def _add_datetime_columns(self, table: pa.Table) -> pa.Table:
+        """Insert IST and UTC datetime columns computed from the epoch 'time' column"""
+        epoch = table['time'].to_numpy()
+        table = table.add_column(1, 'datetime', pa.array(epoch.astype('int64').astype('datetime64[s]')))
+        return table.add_column(1, 'datetime_ist', pa.array(epoch_to_ist(epoch)))
+
+    def _format_for_csv(self, table: pa.Table) -> pa.Table:
+        """
+        Render timestamps to whole seconds and round float64 columns to 8 decimal places
+        
+        float32 columns are left as-is: the CSV writer already prints their shortest
+        repr, while rounding them (in either precision) exposes float32 noise
+        """
+        for i, field in enumerate(table.schema):
+            column = table.column(i)
+            if pa.types.is_timestamp(field.type):
+                column = pc.strftime(column.cast(pa.timestamp('s', tz=field.type.tz)),
+                                     format='%Y-%m-%d %H:%M:%S')
+            elif pa.types.is_float64(field.type):
+                # numpy rounds float64 to the nearest representable value; pc.round can
+                # leave artifacts such as 3003.7999999999997
+                column = pa.array(np.round(column.to_numpy(), 8), from_pandas=True)
+            else:
+                continue
+            table = table.set_column(i, field.name, column)
+        return table
+
     def fetch_symbol_data(self, symbol: str) -> pd.DataFrame:
         """Fetch all data for a single symbol with enhanced error handling"""
         start_timestamp, end_timestamp, start_date, end_date = get_date_range()
@@ -207,7 +449,7 @@ class DeltaExchangeDataFetcher:
         try:
             candles = self.fetch_all_candles(symbol, start_timestamp, end_timestamp)
             
-            if not candles:
+            if candles.num_rows == 0:
                 logger.error(f"No data fetched for {symbol}")
                 return pd.DataFrame()
             
@@ -222,34 +464,84 @@ class DeltaExchangeDataFetcher:
             logger.error(f"Error processing {symbol}: {e}")
             return pd.DataFrame()
 
+    def stream_symbol_to_parquet(self, symbol: str) -> Optional[str]:
+        """
+        Fetch all data for a single symbol, writing each batch to Parquet as it arrives
+        
+        Each batch becomes one row group, so peak memory is a single batch no matter
+        how long the history is. The file holds the raw candle columns (CANDLE_SCHEMA)
+        and is named with a _raw.parquet suffix; use fetch_symbol_data for the enriched
+        DataFrame.
+        
+        Returns:
+            str: Path of the written file, or None if the fetch failed
+        """
+        start_timestamp, end_timestamp, start_date, end_date = get_date_range()
+        # Distinct suffix so this raw-schema file never overwrites the enriched
+        # Parquet output that save_to_csv writes when OUTPUT_FORMAT is "parquet"
+        filepath = self._output_path(symbol, start_date, end_date, "parquet", suffix="_raw")
+        
+        logger.info(f"Streaming {symbol} from {start_date} to {end_date} into {filepath}")
+        
+        rows_written = 0
+        last_time = None
+        try:
+            with pq.ParquetWriter(filepath, schema=CANDLE_SCHEMA, compression='zstd') as writer:
+                for batch in self.iter_candle_batches(symbol, start_timestamp, end_timestamp):
+                    # Batches arrive in window order: sort within the batch and skip
+                    # candles already written by the previous one
+                    table = self._deduplicate_candles(pa.Table.from_batches([batch]), symbol)
+                    if last_time is not None:
+                        table = table.filter(pc.greater(table['time'], last_time))
+                    if table.num_rows == 0:
+                        continue
+                    
+                    writer.write_table(table)
+                    rows_written += table.num_rows
+                    last_time = table['time'][-1].as_py()
+                    
+        except Exception as e:
+            logger.error(f"Error streaming {symbol}: {e}")
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            return None
+        
+        logger.info(f"Streamed {rows_written} {RESOLUTION_OPTIONS[self.resolution]} records to {filepath}")
+        return filepath
+
     def fetch_multiple_symbols(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
-        """Fetch data for multiple symbols with progress tracking"""
+        """Fetch data for multiple symbols concurrently, sharing one rate limiter"""
         results = {}
         total_symbols = len(symbols)
+        completed = 0
         
         logger.info(f"Starting batch fetch for {total_symbols} symbols using {RESOLUTION_OPTIONS[self.resolution]} resolution (No authentication required)")
         
-        for i, symbol in enumerate(symbols, 1):
-            try:
-                logger.info(f"Processing symbol {i}/{total_symbols}: {symbol}")
-                df = self.fetch_symbol_data(symbol)
-                results[symbol] = df
-                
-                # Progress update
-                if not df.empty:
-                    logger.info(f"✅ {symbol}: {len(df)} {RESOLUTION_OPTIONS[self.resolution]} records fetched successfully")
-                else:
-                    logger.warning(f"⚠️  {symbol}: No data retrieved")
-                
-                # Brief pause between symbols
-                if i < total_symbols:
-                    time.sleep(1)
+        # Requests are network-bound, so threads overlap round trips while the
+        # token bucket keeps the combined request rate within limits
+        max_workers = max(1, min(MAX_WORKERS, total_symbols))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.fetch_symbol_data, symbol): symbol for symbol in symbols}
+            
+            for future in as_completed(futures):
+                symbol = futures[future]
+                completed += 1
+                try:
+                    df = future.result()
+                    results[symbol] = df
                     
-            except Exception as e:
-                logger.error(f"❌ Failed to fetch data for {symbol}: {e}")
-                results[symbol] = pd.DataFrame()
+                    # Progress update
+                    if not df.empty:
+                        logger.info(f"✅ {symbol} ({completed}/{total_symbols}): {len(df)} {RESOLUTION_OPTIONS[self.resolution]} records fetched successfully")
+                    else:
+                        logger.warning(f"⚠️  {symbol} ({completed}/{total_symbols}): No data retrieved")
+                        
+                except Exception as e:
+                    logger.error(f"❌ Failed to fetch data for {symbol}: {e}")
+                    results[symbol] = pd.DataFrame()
         
-        return results
+        # Keep the caller's symbol order regardless of completion order
+        return {symbol: results[symbol] for symbol in symbols}
 
     def __del__(self):
         """Clean up session on object destruction"""
@@ -17,7 +17,7 @@ import os
 from pathlib import Path
 
 from data_fetcher import DeltaExchangeDataFetcher
-from config import SYMBOLS, get_date_range, RESOLUTION_OPTIONS
+from config import SYMBOLS, get_date_range, RESOLUTION_OPTIONS, OUTPUT_FORMAT
 
 # Setup comprehensive logging
 log_file = Path('logs') / 'data_fetcher.log'
@@ -137,7 +137,7 @@ def main():
         if successful_symbols:
             logger.info(f"✅ Data fetching completed successfully for {len(successful_symbols)} symbols!")
             print(f"\n🎉 Success! {RESOLUTION_OPTIONS[resolution]} data has been saved for: {', '.join(successful_symbols)}")
-            print(f"💡 Files are saved with format: SYMBOL_{resolution}_STARTDATE_ENDDATE.csv")
+            print(f"💡 Files are saved with format: SYMBOL_{resolution}_STARTDATE_ENDDATE.{OUTPUT_FORMAT}")
         else:
             logger.error("❌ No data was successfully fetched for any symbol")
             print("\n⚠️  Warning: No data was fetched. Please check your internet connection and try again.")
@@ -9,9 +9,14 @@ RSI Settings: Upper limit 60, Lower limit 40, Middle 50, Length 14
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
 from pathlib import Path
 import logging
+import csv
 from typing import Tuple, Dict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import os
 
 # Import TA-Lib for technical analysis
@@ -24,10 +29,88 @@ except ImportError:
     print("   https://www.lfd.uci.edu/~gohlke/pythonlibs/#ta-lib")
     exit(1)
 
+# Bind the TA-Lib functions once instead of resolving them on every call
+_RSI = talib.RSI
+_SMA = talib.SMA
+_EMA = talib.EMA
+_MACD = talib.MACD
+_ATR = talib.ATR
+_BBANDS = talib.BBANDS
+_OBV = talib.OBV
+_ADX = talib.ADX
+
+# Numba is optional; without it the crossover classifier falls back to NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Fixed label sets for the derived signal columns, stored as categoricals.
+# Two-label sets are ordered so a boolean mask can be used directly as the codes.
+SIGNAL_CATEGORIES = {
+    'EMA_Cross_Signal': ['No Data', 'Bullish Cross', 'Bearish Cross', 'Bullish', 'Bearish', 'Neutral'],
+    'RSI_Signal': ['No Data', 'Overbought', 'Oversold', 'Neutral'],
+    'Price_vs_SMA': ['No Data', 'Above', 'Below'],
+    'SMA_Trend': ['No Data', 'Rising', 'Falling', 'Flat'],
+    'EMA_9_vs_21': ['No Data', 'Above', 'Below'],
+    'MACD_Cross': ['Bearish', 'Bullish'],
+    'BB_Position': ['Above', 'Below', 'Inside'],
+    'Price_vs_VWAP': ['Below', 'Above'],
+    'OBV_Change': ['Increasing', 'Decreasing', 'Neutral'],
+    'ADX_Strength': ['Weak', 'Strong']
+}
+
+# Column layout of the consolidated ALL_INDICATORS file
+CONSOLIDATED_COLS = [
+    'datetime', 'open', 'high', 'low', 'close', 'volume',
+    'RSI_14', 'SMA_50', 'EMA_9', 'EMA_21', 'EMA_Cross_Signal', 'ATR_14',
+    'MACD', 'MACD_Signal', 'MACD_Hist', 'BB_Upper', 'BB_Middle', 'BB_Lower',
+    'VWAP', 'OBV', 'ADX',
+    'RSI_Signal', 'RSI_Above_50', 'RSI_Momentum', 'Price_vs_SMA', 'SMA_Trend',
+    'EMA_9_vs_21', 'MACD_Cross', 'BB_Position', 'Price_vs_VWAP', 'OBV_Change',
+    'ADX_Strength'
+]
+
+def _binary_signal(mask: np.ndarray, column: str) -> pd.Categorical:
+    """Map a boolean mask onto a two-label signal column without building string arrays"""
+    return pd.Categorical.from_codes(mask.view(np.int8), categories=SIGNAL_CATEGORIES[column])
+
+def _select_signal(conditions: list, labels: list, default: str, column: str) -> pd.Categorical:
+    """Like np.select, but chooses category codes for a signal column instead of strings"""
+    categories = SIGNAL_CATEGORIES[column]
+    codes = np.select(
+        conditions,
+        [np.int8(categories.index(label)) for label in labels],
+        default=np.int8(categories.index(default))
+    )
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+def _write_csv(frame: pd.DataFrame, path: Path) -> None:
+    """
+    Write a DataFrame to CSV through PyArrow's multi-threaded writer
+    
+    Args:
+        frame: DataFrame to write (the index is dropped)
+        path: Destination CSV file
+    """
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        # Keep the same text pandas' to_csv produced for timestamps and booleans
+        if pa.types.is_timestamp(field.type):
+            column = pc.strftime(column.cast(pa.timestamp('s', tz=field.type.tz)),
+                                 format='%Y-%m-%d %H:%M:%S')
+        elif pa.types.is_boolean(field.type):
+            column = pc.if_else(column, 'True', 'False')
+        else:
+            continue
+        table = table.set_column(i, field.name, column)
+    pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(batch_size=65536))
+
 def create_output_directories(base_dir: str = 'data') -> Dict[str, Path]:
     """
     Create output directories for all technical indicators
@@ -48,12 +131,13 @@ def create_output_directories(base_dir: str = 'data') -> Dict[str, Path]:
         'bbands': base_path / 'BBANDS',
         'vwap': base_path / 'VWAP',
         'obv': base_path / 'OBV',
-        'adx': base_path / 'ADX'
+        'adx': base_path / 'ADX',
+        'consolidated': base_path / 'consolidated'
     }
     
     # Create directories if they don't exist
     for dir_path in dirs.values():
-        dir_path.mkdir(exist_ok=True)
+        dir_path.mkdir(parents=True, exist_ok=True)
     
     logger.info(f"Created output directories in {base_dir}")
     return dirs
@@ -69,38 +153,77 @@ def calculate_rsi(data: pd.DataFrame, periods: int = 14) -> pd.Series:
     Returns:
         pandas.Series: RSI values
     """
-    return pd.Series(talib.RSI(data['close'].values, timeperiod=periods), index=data.index)
+    return pd.Series(_RSI(data['close'].values, timeperiod=periods), index=data.index)
 
 def calculate_sma(data: pd.DataFrame, periods: int = 50) -> pd.Series:
     """
     Calculate SMA using TA-Lib
     """
-    return pd.Series(talib.SMA(data['close'].values, timeperiod=periods), index=data.index)
+    return pd.Series(_SMA(data['close'].values, timeperiod=periods), index=data.index)
 
 def calculate_ema_crossover(data: pd.DataFrame) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """
     Calculate EMA 9-21 crossover using TA-Lib
     """
-    ema9 = pd.Series(talib.EMA(data['close'].values, timeperiod=9), index=data.index)
-    ema21 = pd.Series(talib.EMA(data['close'].values, timeperiod=21), index=data.index)
-    
-    crossover = pd.Series(index=data.index, dtype='object')
-    for i in range(1, len(ema9)):
-        if pd.notna(ema9.iloc[i]) and pd.notna(ema21.iloc[i]) and pd.notna(ema9.iloc[i-1]) and pd.notna(ema21.iloc[i-1]):
-            if ema9.iloc[i] > ema21.iloc[i] and ema9.iloc[i-1] <= ema21.iloc[i-1]:
-                crossover.iloc[i] = 'Bullish Cross'
-            elif ema9.iloc[i] < ema21.iloc[i] and ema9.iloc[i-1] >= ema21.iloc[i-1]:
-                crossover.iloc[i] = 'Bearish Cross'
-            elif ema9.iloc[i] > ema21.iloc[i]:
-                crossover.iloc[i] = 'Bullish'
-            elif ema9.iloc[i] < ema21.iloc[i]:
-                crossover.iloc[i] = 'Bearish'
+    close = data['close'].to_numpy(dtype=np.float64)
+    ema9 = _EMA(close, timeperiod=9)
+    ema21 = _EMA(close, timeperiod=21)
+    
+    return (pd.Series(ema9, index=data.index),
+            pd.Series(ema21, index=data.index),
+            pd.Series(ema_cross_signal(ema9, ema21), index=data.index))
+
+def _ema_cross_codes_numpy(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """NumPy version of the crossover classifier, used when Numba is not installed"""
+    a_prev = np.empty_like(a)
+    b_prev = np.empty_like(b)
+    a_prev[0] = b_prev[0] = np.nan
+    a_prev[1:] = a[:-1]
+    b_prev[1:] = b[:-1]
+    
+    valid = ~(np.isnan(a) | np.isnan(b) | np.isnan(a_prev) | np.isnan(b_prev))
+    bull_cross = valid & (a > b) & (a_prev <= b_prev)
+    bear_cross = valid & (a < b) & (a_prev >= b_prev)
+    bull = valid & (a > b)
+    bear = valid & (a < b)
+    
+    return np.select([bull_cross, bear_cross, bull, bear, valid], [1, 2, 3, 4, 5], default=0).astype(np.int8)
+
+if njit is not None:
+    @njit(cache=True)
+    def _ema_cross_codes(a, b):
+        """Single-pass crossover classifier compiled with Numba"""
+        n = a.size
+        out = np.zeros(n, np.int8)
+        for i in range(1, n):
+            cur_a, cur_b, prev_a, prev_b = a[i], b[i], a[i - 1], b[i - 1]
+            if np.isnan(cur_a) or np.isnan(cur_b) or np.isnan(prev_a) or np.isnan(prev_b):
+                continue
+            if cur_a > cur_b:
+                out[i] = 1 if prev_a <= prev_b else 3
+            elif cur_a < cur_b:
+                out[i] = 2 if prev_a >= prev_b else 4
             else:
-                crossover.iloc[i] = 'Neutral'
-        else:
-            crossover.iloc[i] = 'No Data'
+                out[i] = 5
+        return out
+else:
+    _ema_cross_codes = _ema_cross_codes_numpy
+
+def ema_cross_signal(a: np.ndarray, b: np.ndarray) -> pd.Categorical:
+    """
+    Classify each bar of a fast/slow EMA pair into a crossover signal
     
-    return ema9, ema21, crossover
+    Args:
+        a: Fast EMA values
+        b: Slow EMA values
+    
+    Returns:
+        pandas.Categorical: Signal labels ('Bullish Cross', 'Bearish Cross', 'Bullish', 'Bearish', 'Neutral', 'No Data')
+    """
+    # Codes index into the category list: 0=No Data, 1=Bullish Cross, 2=Bearish Cross,
+    # 3=Bullish, 4=Bearish, 5=Neutral
+    codes = _ema_cross_codes(a, b)
+    return pd.Categorical.from_codes(codes, categories=SIGNAL_CATEGORIES['EMA_Cross_Signal'])
 
 def calculate_atr(data: pd.DataFrame, periods: int = 14) -> pd.Series:
     """
@@ -114,7 +237,7 @@ def calculate_atr(data: pd.DataFrame, periods: int = 14) -> pd.Series:
         pandas.Series: ATR values
     """
     return pd.Series(
-        talib.ATR(
+        _ATR(
             data['high'].values,
             data['low'].values,
             data['close'].values,
@@ -133,7 +256,7 @@ def calculate_macd(data: pd.DataFrame) -> Tuple[pd.Series, pd.Series, pd.Series]
     Returns:
         tuple: (MACD line, Signal line, MACD histogram)
     """
-    macd, signal, hist = talib.MACD(
+    macd, signal, hist = _MACD(
         data['close'].values,
         fastperiod=12,
         slowperiod=26,
@@ -154,7 +277,7 @@ def calculate_bbands(data: pd.DataFrame, periods: int = 20) -> Tuple[pd.Series,
     Returns:
         tuple: (Upper band, Middle band, Lower band)
     """
-    upper, middle, lower = talib.BBANDS(
+    upper, middle, lower = _BBANDS(
         data['close'].values,
         timeperiod=periods,
         nbdevup=2,
@@ -175,9 +298,45 @@ def calculate_vwap(data: pd.DataFrame) -> pd.Series:
     Returns:
         pandas.Series: VWAP values
     """
-    typical_price = (data['high'] + data['low'] + data['close']) / 3
-    vwap = (typical_price * data['volume']).cumsum() / data['volume'].cumsum()
-    return vwap
+    vwap = vwap_array(
+        data['high'].to_numpy(dtype=np.float64),
+        data['low'].to_numpy(dtype=np.float64),
+        data['close'].to_numpy(dtype=np.float64),
+        data['volume'].to_numpy(dtype=np.float64)
+    )
+    return pd.Series(vwap, index=data.index, copy=False)
+
+def _cumsum_skipna(values: np.ndarray) -> np.ndarray:
+    """Cumulative sum in place that skips NaNs but keeps them in the output, like pandas"""
+    missing = np.isnan(values)
+    if missing.any():
+        values[missing] = 0.0
+        np.cumsum(values, out=values)
+        values[missing] = np.nan
+    else:
+        np.cumsum(values, out=values)
+    return values
+
+def vwap_array(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    Calculate VWAP on raw float64 arrays, reusing a single scratch buffer
+    
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volumes (not modified)
+    
+    Returns:
+        numpy.ndarray: VWAP values
+    """
+    pv = np.add(high, low)
+    np.add(pv, close, out=pv)
+    np.divide(pv, 3, out=pv)
+    np.multiply(pv, volume, out=pv)
+    _cumsum_skipna(pv)
+    cum_volume = _cumsum_skipna(volume.copy())
+    return np.divide(pv, cum_volume, out=pv)
 
 def calculate_obv(data: pd.DataFrame) -> pd.Series:
     """
@@ -189,7 +348,7 @@ def calculate_obv(data: pd.DataFrame) -> pd.Series:
     Returns:
         pandas.Series: OBV values
     """
-    return pd.Series(talib.OBV(data['close'].values, data['volume'].values), index=data.index)
+    return pd.Series(_OBV(data['close'].values, data['volume'].values), index=data.index)
 
 def calculate_adx(data: pd.DataFrame, periods: int = 14) -> pd.Series:
     """
@@ -203,7 +362,7 @@ def calculate_adx(data: pd.DataFrame, periods: int = 14) -> pd.Series:
         pandas.Series: ADX values
     """
     return pd.Series(
-        talib.ADX(
+        _ADX(
             data['high'].values,
             data['low'].values,
             data['close'].values,
@@ -245,222 +404,192 @@ def process_csv_file(file_path: Path, dirs: Dict[str, Path]) -> Dict:
         dict: Processing statistics
     """
     try:
-        # Read CSV file
-        df = pd.read_csv(file_path)
-        
-        # Convert datetime column
-        df['datetime'] = pd.to_datetime(df['datetime'])
-        
         # Ensure column names match what we need
         required_columns = ['datetime', 'open', 'high', 'low', 'close', 'volume']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        with open(file_path, newline='') as f:
+            header = next(csv.reader(f), [])
+        missing_columns = [col for col in required_columns if col not in header]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
         
-        # Sort by datetime to ensure proper order
-        df = df.sort_values('datetime').reset_index(drop=True)
+        # Read only the required columns, parsed straight to float64/timestamp
+        column_types = {col: pa.float64() for col in required_columns[1:]}
+        column_types['datetime'] = pa.timestamp('ns')
+        table = pacsv.read_csv(
+            file_path,
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types,
+                include_columns=required_columns
+            )
+        )
+        df = table.to_pandas()
+        del table
         
-        # Convert numeric columns to float64 (double) explicitly
-        numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+        # Sort by datetime to ensure proper order; exchange dumps are usually chronological already
+        dt = df['datetime'].to_numpy()
+        if not np.all(dt[1:] >= dt[:-1]):
+            df = df.sort_values('datetime', kind='mergesort', ignore_index=True)
         
         # Create datasets for each indicator
         base_filename = file_path.stem
 
-        logger.info(f"Calculating indicators for {file_path.name}...")
-
-        # Calculate all indicators first
-        df['RSI_14'] = calculate_rsi(df, periods=14)
-        df['SMA_50'] = calculate_sma(df, periods=50)
-        ema9, ema21, ema_cross_signal = calculate_ema_crossover(df)
-        df['EMA_9'], df['EMA_21'], df['EMA_Cross_Signal'] = ema9, ema21, ema_cross_signal
-        df['ATR_14'] = calculate_atr(df, periods=14)
-        macd, signal, hist = calculate_macd(df)
-        df['MACD'], df['MACD_Signal'], df['MACD_Hist'] = macd, signal, hist
-        upper, middle, lower = calculate_bbands(df, periods=20)
-        df['BB_Upper'], df['BB_Middle'], df['BB_Lower'] = upper, middle, lower
-        df['VWAP'] = calculate_vwap(df)
-        df['OBV'] = calculate_obv(df)
-        df['ADX'] = calculate_adx(df, periods=14)
+        logger.info("Calculating indicators for %s...", file_path.name)
+
+        # Unwrap the OHLCV columns once and feed the raw float64 arrays to TA-Lib
+        close = df['close'].to_numpy(dtype=np.float64, copy=False)
+        high = df['high'].to_numpy(dtype=np.float64, copy=False)
+        low = df['low'].to_numpy(dtype=np.float64, copy=False)
+        volume = df['volume'].to_numpy(dtype=np.float64, copy=False)
+
+        # Calculate all indicators first, keeping the raw arrays for the signals and stats
+        rsi = _RSI(close, timeperiod=14)
+        sma = _SMA(close, timeperiod=50)
+        ema9 = _EMA(close, timeperiod=9)
+        ema21 = _EMA(close, timeperiod=21)
+        ema_cross = ema_cross_signal(ema9, ema21)
+        atr = _ATR(high, low, close, timeperiod=14)
+        macd, macd_signal, macd_hist = _MACD(
+            close, fastperiod=12, slowperiod=26, signalperiod=9
+        )
+        bb_upper, bb_middle, bb_lower = _BBANDS(
+            close, timeperiod=20, nbdevup=2, nbdevdn=2, matype=0
+        )
+        vwap = vwap_array(high, low, close, volume)
+        obv = _OBV(close, volume)
+        adx = _ADX(high, low, close, timeperiod=14)
+
+        # Store bounded and price-scale indicators as float32 to halve their footprint;
+        # signals and stats below still use the float64 arrays so no threshold
+        # comparison loses precision. OBV stays float64: it is an unbounded integer
+        # running sum and float32 cannot represent every integer above 2**24
+        df['RSI_14'] = rsi.astype(np.float32)
+        df['SMA_50'] = sma.astype(np.float32)
+        df['EMA_9'], df['EMA_21'] = ema9.astype(np.float32), ema21.astype(np.float32)
+        df['EMA_Cross_Signal'] = ema_cross
+        df['ATR_14'] = atr.astype(np.float32)
+        df['MACD'] = macd.astype(np.float32)
+        df['MACD_Signal'] = macd_signal.astype(np.float32)
+        df['MACD_Hist'] = macd_hist.astype(np.float32)
+        df['BB_Upper'] = bb_upper.astype(np.float32)
+        df['BB_Middle'] = bb_middle.astype(np.float32)
+        df['BB_Lower'] = bb_lower.astype(np.float32)
+        df['VWAP'] = vwap.astype(np.float32)
+        df['OBV'] = obv
+        df['ADX'] = adx.astype(np.float32)
+
+        logger.debug("Deriving signal columns...")
+
+        # Derive every signal column once on df as 1-byte category codes; the datasets
+        # below only select columns
+        df['RSI_Signal'] = _select_signal(
+            [np.isnan(rsi), rsi >= 60, rsi <= 40], ['No Data', 'Overbought', 'Oversold'], 'Neutral', 'RSI_Signal'
+        )
+        df['RSI_Above_50'] = rsi > 50
+        df['RSI_Momentum'] = np.diff(rsi, prepend=np.nan).astype(np.float32)
 
-        logger.info(f"Creating indicator datasets...")
+        df['Price_vs_SMA'] = _select_signal(
+            [close > sma, np.isnan(sma)], ['Above', 'No Data'], 'Below', 'Price_vs_SMA'
+        )
+        sma_diff = np.diff(sma, prepend=np.nan)
+        df['SMA_Trend'] = _select_signal(
+            [np.isnan(sma_diff), sma_diff > 0, sma_diff < 0], ['No Data', 'Rising', 'Falling'], 'Flat', 'SMA_Trend'
+        )
 
-        # RSI dataset
-        rsi_data = df[['datetime', 'close', 'RSI_14']].copy()
-        rsi_data['RSI_Signal'] = rsi_data['RSI_14'].apply(
-            lambda x: get_rsi_signal(x, upper_limit=60, lower_limit=40)
+        df['EMA_9_vs_21'] = _select_signal(
+            [ema9 > ema21, np.isnan(ema9) | np.isnan(ema21)], ['Above', 'No Data'], 'Below', 'EMA_9_vs_21'
         )
-        rsi_data['RSI_Above_50'] = rsi_data['RSI_14'] > 50
-        rsi_data['RSI_Momentum'] = rsi_data['RSI_14'].diff()
-        rsi_data.to_csv(dirs['rsi'] / f"{base_filename}_RSI14.csv", index=False)
-        logger.info(f"✓ RSI dataset saved")
 
-        # SMA dataset
-        sma_data = df[['datetime', 'close', 'SMA_50']].copy()
-        sma_data['Price_vs_SMA'] = sma_data.apply(
-            lambda row: 'Above' if row['close'] > row['SMA_50'] else 'Below' if pd.notna(row['SMA_50']) else 'No Data', axis=1
+        df['MACD_Cross'] = _binary_signal(macd > macd_signal, 'MACD_Cross')
+
+        df['BB_Position'] = _select_signal(
+            [close > bb_upper, close < bb_lower], ['Above', 'Below'], 'Inside', 'BB_Position'
         )
-        sma_data['SMA_Trend'] = sma_data['SMA_50'].diff().apply(
-            lambda x: 'Rising' if x > 0 else 'Falling' if x < 0 else 'Flat' if x == 0 else 'No Data'
+
+        df['Price_vs_VWAP'] = _binary_signal(close > vwap, 'Price_vs_VWAP')
+
+        obv_diff = np.diff(obv, prepend=np.nan)
+        df['OBV_Change'] = _select_signal(
+            [obv_diff > 0, obv_diff < 0], ['Increasing', 'Decreasing'], 'Neutral', 'OBV_Change'
         )
-        sma_data.to_csv(dirs['sma'] / f"{base_filename}_SMA50.csv", index=False)
-        logger.info(f"✓ SMA dataset saved")
+
+        df['ADX_Strength'] = _binary_signal(adx > 25, 'ADX_Strength')
+
+        logger.debug("Creating indicator datasets...")
+
+        # RSI dataset
+        rsi_data = df[['datetime', 'close', 'RSI_14', 'RSI_Signal', 'RSI_Above_50', 'RSI_Momentum']]
+        _write_csv(rsi_data, dirs['rsi'] / f"{base_filename}_RSI14.csv")
+        logger.debug("✓ RSI dataset saved")
+
+        # SMA dataset
+        sma_data = df[['datetime', 'close', 'SMA_50', 'Price_vs_SMA', 'SMA_Trend']]
+        _write_csv(sma_data, dirs['sma'] / f"{base_filename}_SMA50.csv")
+        logger.debug("✓ SMA dataset saved")
 
         # EMA Crossover dataset
-        ema_cross_data = df[['datetime', 'close', 'EMA_9', 'EMA_21', 'EMA_Cross_Signal']].copy()
-        ema_cross_data['EMA_9_vs_21'] = ema_cross_data.apply(
-            lambda row: 'Above' if row['EMA_9'] > row['EMA_21'] else 'Below' if pd.notna(row['EMA_9']) and pd.notna(row['EMA_21']) else 'No Data', axis=1
-        )
-        ema_cross_data.to_csv(dirs['ema_cross'] / f"{base_filename}_EMA_CROSSOVER.csv", index=False)
-        logger.info(f"✓ EMA Crossover dataset saved")
+        ema_cross_data = df[['datetime', 'close', 'EMA_9', 'EMA_21', 'EMA_Cross_Signal', 'EMA_9_vs_21']]
+        _write_csv(ema_cross_data, dirs['ema_cross'] / f"{base_filename}_EMA_CROSSOVER.csv")
+        logger.debug("✓ EMA Crossover dataset saved")
 
         # ATR dataset
-        atr_data = df[['datetime', 'close', 'ATR_14']].copy()
-        atr_data.to_csv(dirs['atr'] / f"{base_filename}_ATR14.csv", index=False)
-        logger.info(f"✓ ATR dataset saved")
+        atr_data = df[['datetime', 'close', 'ATR_14']]
+        _write_csv(atr_data, dirs['atr'] / f"{base_filename}_ATR14.csv")
+        logger.debug("✓ ATR dataset saved")
 
         # MACD dataset
-        macd_data = df[['datetime', 'close', 'MACD', 'MACD_Signal', 'MACD_Hist']].copy()
-        macd_data['MACD_Cross'] = np.where(macd_data['MACD'] > macd_data['MACD_Signal'], 'Bullish', 'Bearish')
-        macd_data.to_csv(dirs['macd'] / f"{base_filename}_MACD.csv", index=False)
-        logger.info(f"✓ MACD dataset saved")
+        macd_data = df[['datetime', 'close', 'MACD', 'MACD_Signal', 'MACD_Hist', 'MACD_Cross']]
+        _write_csv(macd_data, dirs['macd'] / f"{base_filename}_MACD.csv")
+        logger.debug("✓ MACD dataset saved")
 
         # Bollinger Bands dataset
-        bb_data = df[['datetime', 'close', 'BB_Upper', 'BB_Middle', 'BB_Lower']].copy()
-        bb_data['BB_Position'] = bb_data.apply(
-            lambda row: 'Above' if row['close'] > row['BB_Upper'] else 'Below' if row['close'] < row['BB_Lower'] else 'Inside', axis=1
-        )
-        bb_data.to_csv(dirs['bbands'] / f"{base_filename}_BBANDS.csv", index=False)
-        logger.info(f"✓ Bollinger Bands dataset saved")
+        bb_data = df[['datetime', 'close', 'BB_Upper', 'BB_Middle', 'BB_Lower', 'BB_Position']]
+        _write_csv(bb_data, dirs['bbands'] / f"{base_filename}_BBANDS.csv")
+        logger.debug("✓ Bollinger Bands dataset saved")
 
         # VWAP dataset
-        vwap_data = df[['datetime', 'close', 'VWAP']].copy()
-        vwap_data['Price_vs_VWAP'] = vwap_data.apply(
-            lambda row: 'Above' if row['close'] > row['VWAP'] else 'Below', axis=1
-        )
-        vwap_data.to_csv(dirs['vwap'] / f"{base_filename}_VWAP.csv", index=False)
-        logger.info(f"✓ VWAP dataset saved")
+        vwap_data = df[['datetime', 'close', 'VWAP', 'Price_vs_VWAP']]
+        _write_csv(vwap_data, dirs['vwap'] / f"{base_filename}_VWAP.csv")
+        logger.debug("✓ VWAP dataset saved")
 
         # OBV dataset
-        obv_data = df[['datetime', 'close', 'OBV']].copy()
-        obv_data['OBV_Change'] = obv_data['OBV'].diff().apply(
-            lambda x: 'Increasing' if x > 0 else 'Decreasing' if x < 0 else 'Neutral'
-        )
-        obv_data.to_csv(dirs['obv'] / f"{base_filename}_OBV.csv", index=False)
-        logger.info(f"✓ OBV dataset saved")
+        obv_data = df[['datetime', 'close', 'OBV', 'OBV_Change']]
+        _write_csv(obv_data, dirs['obv'] / f"{base_filename}_OBV.csv")
+        logger.debug("✓ OBV dataset saved")
 
         # ADX dataset
-        adx_data = df[['datetime', 'close', 'ADX']].copy()
-        adx_data['Trend_Strength'] = adx_data['ADX'].apply(
-            lambda x: 'Strong' if x > 25 else 'Weak'
+        adx_data = df[['datetime', 'close', 'ADX', 'ADX_Strength']].rename(
+            columns={'ADX_Strength': 'Trend_Strength'}
         )
-        adx_data.to_csv(dirs['adx'] / f"{base_filename}_ADX.csv", index=False)
-        logger.info(f"✓ ADX dataset saved")
+        _write_csv(adx_data, dirs['adx'] / f"{base_filename}_ADX.csv")
+        logger.debug("✓ ADX dataset saved")
 
         # Save consolidated dataset with all indicators
-        consolidated_dir = Path(dirs['rsi']).parent / 'consolidated'
-        consolidated_dir.mkdir(exist_ok=True)
-        
-        # Create consolidated DataFrame with all data
-        consolidated_data = df[['datetime', 'open', 'high', 'low', 'close', 'volume']].copy()
-        
-        # Add all technical indicators
-        consolidated_data['RSI_14'] = df['RSI_14']
-        consolidated_data['SMA_50'] = df['SMA_50']
-        consolidated_data['EMA_9'] = df['EMA_9']
-        consolidated_data['EMA_21'] = df['EMA_21']
-        consolidated_data['EMA_Cross_Signal'] = df['EMA_Cross_Signal']
-        consolidated_data['ATR_14'] = df['ATR_14']
-        consolidated_data['MACD'] = df['MACD']
-        consolidated_data['MACD_Signal'] = df['MACD_Signal']
-        consolidated_data['MACD_Hist'] = df['MACD_Hist']
-        consolidated_data['BB_Upper'] = df['BB_Upper']
-        consolidated_data['BB_Middle'] = df['BB_Middle']
-        consolidated_data['BB_Lower'] = df['BB_Lower']
-        consolidated_data['VWAP'] = df['VWAP']
-        consolidated_data['OBV'] = df['OBV']
-        consolidated_data['ADX'] = df['ADX']
-        
-        # Add all signal columns
-        consolidated_data['RSI_Signal'] = consolidated_data['RSI_14'].apply(
-            lambda x: get_rsi_signal(x, upper_limit=60, lower_limit=40)
-        )
-        consolidated_data['RSI_Above_50'] = consolidated_data['RSI_14'] > 50
-        consolidated_data['RSI_Momentum'] = consolidated_data['RSI_14'].diff()
+        consolidated_file = dirs['consolidated'] / f"{base_filename}_ALL_INDICATORS.csv"
+        _write_csv(df[CONSOLIDATED_COLS], consolidated_file)
+        logger.debug("✓ Consolidated dataset saved to %s", consolidated_file.name)
         
-        consolidated_data['Price_vs_SMA'] = consolidated_data.apply(
-            lambda row: 'Above' if row['close'] > row['SMA_50'] else 'Below' if pd.notna(row['SMA_50']) else 'No Data',
-            axis=1
-        )
-        
-        consolidated_data['SMA_Trend'] = consolidated_data['SMA_50'].diff().apply(
-            lambda x: 'Rising' if x > 0 else 'Falling' if x < 0 else 'Flat' if x == 0 else 'No Data'
-        )
-        
-        consolidated_data['EMA_9_vs_21'] = consolidated_data.apply(
-            lambda row: 'Above' if row['EMA_9'] > row['EMA_21'] else 'Below' if pd.notna(row['EMA_9']) and pd.notna(row['EMA_21']) else 'No Data',
-            axis=1
-        )
-        
-        consolidated_data['MACD_Cross'] = np.where(
-            consolidated_data['MACD'] > consolidated_data['MACD_Signal'],
-            'Bullish',
-            'Bearish'
-        )
-        
-        consolidated_data['BB_Position'] = consolidated_data.apply(
-            lambda row: 'Above' if row['close'] > row['BB_Upper']
-            else 'Below' if row['close'] < row['BB_Lower']
-            else 'Inside',
-            axis=1
-        )
-        
-        consolidated_data['Price_vs_VWAP'] = consolidated_data.apply(
-            lambda row: 'Above' if row['close'] > row['VWAP'] else 'Below',
-            axis=1
-        )
-        
-        consolidated_data['OBV_Change'] = consolidated_data['OBV'].diff().apply(
-            lambda x: 'Increasing' if x > 0 else 'Decreasing' if x < 0 else 'Neutral'
-        )
-        
-        consolidated_data['ADX_Strength'] = consolidated_data['ADX'].apply(
-            lambda x: 'Strong' if x > 25 else 'Weak'
-        )
-        
-        # Save consolidated file
-        consolidated_file = consolidated_dir / f"{base_filename}_ALL_INDICATORS.csv"
-        consolidated_data.to_csv(consolidated_file, index=False)
-        logger.info(f"✓ Consolidated dataset saved to {consolidated_file.name}")
-        
-        # Calculate statistics with valid data only
-        valid_rsi_data = rsi_data.dropna(subset=['RSI_14'])
-        valid_sma_data = sma_data.dropna(subset=['SMA_50'])
-        
-        # Get latest values for stats
-        last_idx = -1
+        # Get latest values for stats straight from the indicator arrays
         current_stats = {
             'symbol': base_filename.split('_')[0],
             'file_processed': file_path.name,
             'total_records': len(df),
-            'current_price': df['close'].iloc[last_idx],
-            'current_rsi': df['RSI_14'].iloc[last_idx],
-            'current_sma': df['SMA_50'].iloc[last_idx],
-            'current_ema9': df['EMA_9'].iloc[last_idx],
-            'current_ema21': df['EMA_21'].iloc[last_idx],
-            'current_ema_cross_signal': df['EMA_Cross_Signal'].iloc[last_idx],
-            'current_atr': df['ATR_14'].iloc[last_idx],
-            'current_macd': df['MACD'].iloc[last_idx],
-            'current_macd_signal': df['MACD_Signal'].iloc[last_idx],
-            'current_bb_upper': df['BB_Upper'].iloc[last_idx],
-            'current_bb_lower': df['BB_Lower'].iloc[last_idx],
-            'current_vwap': df['VWAP'].iloc[last_idx],
-            'current_adx': df['ADX'].iloc[last_idx],
-            'rsi_signal': get_rsi_signal(df['RSI_14'].iloc[last_idx]),
-            'macd_signal': 'Bullish' if df['MACD'].iloc[last_idx] > df['MACD_Signal'].iloc[last_idx] else 'Bearish',
-            'bb_position': 'Above' if df['close'].iloc[last_idx] > df['BB_Upper'].iloc[last_idx] else 'Below' if df['close'].iloc[last_idx] < df['BB_Lower'].iloc[last_idx] else 'Inside',
-            'adx_strength': 'Strong' if df['ADX'].iloc[last_idx] > 25 else 'Weak',
+            'current_price': close[-1],
+            'current_rsi': rsi[-1],
+            'current_sma': sma[-1],
+            'current_ema9': ema9[-1],
+            'current_ema21': ema21[-1],
+            'current_ema_cross_signal': ema_cross[-1],
+            'current_atr': atr[-1],
+            'current_macd': macd[-1],
+            'current_macd_signal': macd_signal[-1],
+            'current_bb_upper': bb_upper[-1],
+            'current_bb_lower': bb_lower[-1],
+            'current_vwap': vwap[-1],
+            'current_adx': adx[-1],
+            'rsi_signal': get_rsi_signal(rsi[-1]),
+            'macd_signal': 'Bullish' if macd[-1] > macd_signal[-1] else 'Bearish',
+            'bb_position': 'Above' if close[-1] > bb_upper[-1] else 'Below' if close[-1] < bb_lower[-1] else 'Inside',
+            'adx_strength': 'Strong' if adx[-1] > 25 else 'Weak',
             'files': {
                 'rsi': str(dirs['rsi'] / f"{base_filename}_RSI14.csv"),
                 'sma': str(dirs['sma'] / f"{base_filename}_SMA50.csv"),
@@ -475,14 +604,15 @@ def process_csv_file(file_path: Path, dirs: Dict[str, Path]) -> Dict:
             }
         }
         
-        logger.info(f"✅ Processed {file_path.name} with all indicators")
-        logger.info(f"   Price: ${current_stats['current_price']:.2f}")
-        logger.info(f"   RSI: {current_stats['current_rsi']:.2f} ({current_stats['rsi_signal']})")
-        logger.info(f"   SMA-50: ${current_stats['current_sma']:.2f}")
-        logger.info(f"   EMA Cross: {current_stats['current_ema_cross_signal']}")
-        logger.info(f"   ADX: {current_stats['current_adx']:.2f} ({current_stats['adx_strength']})")
-        logger.info(f"   MACD Signal: {current_stats['macd_signal']}")
-        logger.info(f"   BB Position: {current_stats['bb_position']}")
+        logger.info("✅ Processed %s with all indicators", file_path.name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"   Price: ${current_stats['current_price']:.2f}")
+            logger.debug(f"   RSI: {current_stats['current_rsi']:.2f} ({current_stats['rsi_signal']})")
+            logger.debug(f"   SMA-50: ${current_stats['current_sma']:.2f}")
+            logger.debug(f"   EMA Cross: {current_stats['current_ema_cross_signal']}")
+            logger.debug(f"   ADX: {current_stats['current_adx']:.2f} ({current_stats['adx_strength']})")
+            logger.debug(f"   MACD Signal: {current_stats['macd_signal']}")
+            logger.debug(f"   BB Position: {current_stats['bb_position']}")
         
         return current_stats
         
@@ -532,11 +662,23 @@ def process_all_csv_files(data_dir: str = 'data') -> Dict:
         
         logger.info(f"Found {len(csv_files)} CSV files to process")
         
-        # Process each CSV file
+        # Files are independent, so process them in separate worker processes
+        max_workers = min(os.cpu_count() or 1, len(csv_files))
+        file_stats = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(process_csv_file, file_path, dirs): file_path
+                       for file_path in csv_files}
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    file_stats[file_path] = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Worker failed on {file_path.name}: {e}")
+                    file_stats[file_path] = None
+        
+        # Collect results in discovery order
         for file_path in csv_files:
-            logger.info(f"Processing {file_path.name}...")
-            
-            stats = process_csv_file(file_path, dirs)
+            stats = file_stats[file_path]
             
             if stats:
                 symbol = stats['symbol']